@@ -1,47 +1,207 @@
 # -*- coding: utf-8 -*-
 import os
-import io
+import re
+import errno
+import shutil
+import itertools
 import tempfile
+import threading
 import zipfile
-from typing import Optional, Tuple
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
-from flask import Flask, render_template, request, send_file, jsonify
+from blake3 import blake3
+from cachetools import TTLCache
+from flask import Flask, Response, render_template, request, send_file, jsonify
+from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
+from zipstream import ZipStream
 
-# 保持 pdf.py 原样不改，这里仅导入
-from pdf import PDFtoDocxConverter
+# 转换逻辑位于 pdf.py，这里仅导入
+from pdf import (convert_single_file, convert_stream, get_pdf_info_bytes,
+                 get_scratch_dir, setup_logging, warm_up)
+
+# 请求体大小上限，超过时在读取上传内容前直接返回 413
+MAX_UPLOAD_SIZE = 200 * 1024 * 1024
+
+# 单文件转换输出在内存中保留的最大字节数，超过后才写入磁盘
+DOCX_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# 页码范围格式："3" 或 "1-5"，允许首尾及连字符两侧的空白
+_PAGE_RANGE_RE = re.compile(r'^\s*(\d+)(?:\s*-\s*(\d+))?\s*$')
+
+# 保存上传文件时每次拷贝的块大小
+UPLOAD_COPY_BUFSIZE = 1 << 20
+# copy_file_range 单次调用最多拷贝的字节数
+UPLOAD_COPY_RANGE_MAX = 1 << 30
+
+# 超过该大小的PDF计算缓存键时启用多线程哈希
+PDF_KEY_PARALLEL_MIN_SIZE = 16 * 1024 * 1024
+
+# 最近上传的PDF缓存：{PDF数据哈希: (PDF数据, 安全文件名)}，供 pdf-info 之后的 convert-single 复用
+# 缓存容量按字节计算；超过单文件上限的PDF不缓存，由转换请求重新上传
+PDF_CACHE_MAX_BYTES = 256 * 1024 * 1024
+PDF_CACHE_MAX_ENTRY_SIZE = 32 * 1024 * 1024
+_pdf_cache = TTLCache(maxsize=PDF_CACHE_MAX_BYTES, ttl=60, getsizeof=lambda v: len(v[0]))
+_pdf_cache_lock = threading.Lock()
+
+# 批量转换共用的进程池，首次使用时创建，之后在各请求间复用
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _pdf_cache_key(data: bytes) -> str:
+    """计算PDF缓存键：blake3 哈希的前 32 个十六进制字符（128 位，进程内去重足够）"""
+    max_threads = blake3.AUTO if len(data) > PDF_KEY_PARALLEL_MIN_SIZE else 1
+    return blake3(data, max_threads=max_threads).hexdigest()[:32]
+
+
+def _convert_worker(pdf_path: str, docx_path: str,
+                    start_page: int, end_page: Optional[int]) -> bool:
+    """进程池工作函数：在子进程中转换单个PDF"""
+    setup_logging()
+    return convert_single_file(pdf_path, docx_path, start_page, end_page)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """获取批量转换进程池：工作进程按需启动并常驻，避免每个请求重新启动解释器、导入依赖
+    进程池因子进程异常退出而失效时重新创建
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None or getattr(_executor, '_broken', False):
+            # spawn 保证跨平台一致
+            _executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                            mp_context=multiprocessing.get_context('spawn'))
+        return _executor
+
+
+def _submit_conversion(task: Tuple[str, str, int, Optional[int]], in_process: bool) -> Future:
+    """提交单个转换任务；in_process 为 True 时直接在当前进程中转换，返回已完成的 Future"""
+    if not in_process:
+        return _get_executor().submit(_convert_worker, *task)
+    future = Future()
+    future.set_result(convert_single_file(*task))
+    return future
+
+
+def _save_upload(file: FileStorage, path: str) -> None:
+    """将上传文件写入磁盘
+    上传内容已缓存在临时文件中时优先用 copy_file_range 在内核中拷贝，
+    不支持时退回以 1 MiB 为块的普通拷贝
+    """
+    with open(path, 'wb') as fh:
+        # 小文件由 Werkzeug 缓存在内存中（未落盘的 SpooledTemporaryFile），
+        # 对其调用 fileno() 会先把内容写入新的临时文件，因此只对已落盘的上传取文件描述符
+        src_fd = None
+        if getattr(file.stream, '_rolled', True):
+            try:
+                src_fd = file.stream.fileno()
+            except (AttributeError, OSError):
+                src_fd = None
+
+        if src_fd is not None and hasattr(os, 'copy_file_range'):
+            try:
+                offset = 0
+                while True:
+                    copied = os.copy_file_range(src_fd, fh.fileno(), UPLOAD_COPY_RANGE_MAX, offset)
+                    if not copied:
+                        return
+                    offset += copied
+            except OSError as e:
+                if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+                fh.seek(0)
+                fh.truncate()
+
+        file.stream.seek(0)
+        shutil.copyfileobj(file.stream, fh, length=UPLOAD_COPY_BUFSIZE)
+
+
+def _iter_converted(futures: Dict[Future, Tuple[str, str]]) -> Iterator[Tuple[str, str]]:
+    """按完成先后产出转换成功的 (DOCX 路径, zip 内文件名)，转换失败的文件直接跳过"""
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None and future.result():
+                yield futures[future]
+
+
+def _cancel_and_wait(futures: Iterable[Future]) -> None:
+    """取消尚未开始的转换，并等待已在运行的转换结束（之后才能安全清理临时目录）"""
+    for future in futures:
+        future.cancel()
+    wait(futures)
+
+
+def _stream_zip(converted: Iterator[Tuple[str, str]], futures: Dict[Future, Tuple[str, str]],
+                td: tempfile.TemporaryDirectory):
+    """每完成一个 DOCX 立即写入zip流发送，全部完成后写入zip目录结构
+    发送结束（或客户端断开）后停止本请求未开始的转换并清理临时目录
+    """
+    # DOCX 本身已是 deflate 压缩的 zip 容器，外层仅存储不再压缩
+    zs = ZipStream(compress_type=zipfile.ZIP_STORED)
+    used_names = set()
+    try:
+        for docx_path, arcname in converted:
+            # 同名文件依次命名为 "name (2).docx"、"name (3).docx" ...
+            base, ext = os.path.splitext(arcname)
+            n = 1
+            while arcname in used_names:
+                n += 1
+                arcname = f"{base} ({n}){ext}"
+            used_names.add(arcname)
+            zs.add_path(docx_path, arcname=arcname)
+            yield from zs.all_files()
+        yield from zs.footer()
+    finally:
+        _cancel_and_wait(futures)
+        td.cleanup()
 
 
 def parse_page_range(page_range: str) -> Tuple[int, Optional[int]]:
     """将类似 "1-5" 或 "3" 的页码范围解析为 (start_page_0_based, end_page_exclusive)
-    与 pdf.py 的交互式逻辑一致：
+    与 cli.py 的交互式逻辑一致：
     - 空字符串: (0, None)
     - "a-b": (a-1, b)
     - "a": (a-1, a)
+    - 格式无效: (0, None)，即转换全部
     """
-    start_page, end_page = 0, None
     if not page_range:
-        return start_page, end_page
-    try:
-        page_range = page_range.strip()
-        if "-" in page_range:
-            a, b = page_range.split("-", 1)
-            start_page = max(int(a) - 1, 0)
-            end_page = int(b)
-        else:
-            start_page = max(int(page_range) - 1, 0)
-            end_page = start_page + 1
-    except Exception:
-        # 解析失败则转换全部
-        start_page, end_page = 0, None
+        return 0, None
+    m = _PAGE_RANGE_RE.match(page_range)
+    if not m:
+        return 0, None
+    start_page = max(int(m.group(1)) - 1, 0)
+    end_page = int(m.group(2)) if m.group(2) else start_page + 1
     return start_page, end_page
 
 
+def parse_workers(workers: str) -> int:
+    """解析单文件转换的页面拆分份数
+    - 空字符串或非法值: 1（单进程转换）
+    - 其他: 限制在 [1, CPU 核数] 范围内
+    pdf2docx 多进程模式每次都会按 CPU 核数创建进程，因此默认不启用
+    """
+    try:
+        return min(max(int(workers), 1), os.cpu_count() or 1)
+    except (TypeError, ValueError):
+        return 1
+
+
 def create_app() -> Flask:
     app = Flask(__name__, static_folder='static', template_folder='templates')
+    app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_SIZE
+
+    # 初始化日志，并在开始处理请求前预热转换依赖
+    setup_logging()
+    warm_up()
 
-    # 初始化转换器
-    converter = PDFtoDocxConverter()
+    @app.errorhandler(413)
+    def request_entity_too_large(e):
+        return jsonify({"ok": False, "msg": f"上传文件过大，最大允许 {MAX_UPLOAD_SIZE // (1024 * 1024)} MB"}), 413
 
     @app.get('/')
     def index():
@@ -52,50 +212,65 @@ def create_app() -> Flask:
         file = request.files.get('pdf')
         if not file:
             return jsonify({"ok": False, "msg": "请上传PDF文件(pdf)"}), 400
-        # 将上传文件写入临时文件
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-            file.save(tmp.name)
-            tmp_pdf_path = tmp.name
-        try:
-            info = converter.get_pdf_info(tmp_pdf_path)
-            if not info:
-                return jsonify({"ok": False, "msg": "获取PDF信息失败"}), 500
+        # 直接从内存读取PDF，无需落盘
+        data = file.read()
+        info = get_pdf_info_bytes(data)
+        if not info:
+            return jsonify({"ok": False, "msg": "获取PDF信息失败"}), 500
+        if len(data) > PDF_CACHE_MAX_ENTRY_SIZE:
             return jsonify({"ok": True, "data": info})
-        finally:
-            try:
-                os.remove(tmp_pdf_path)
-            except Exception:
-                pass
+        # 缓存PDF数据，随后的转换请求可通过 pdf_sha 复用而无需重新上传
+        pdf_sha = _pdf_cache_key(data)
+        with _pdf_cache_lock:
+            _pdf_cache[pdf_sha] = (data, secure_filename(file.filename))
+        return jsonify({"ok": True, "data": info, "pdf_sha": pdf_sha})
 
     @app.post('/api/convert-single')
     def convert_single():
         file = request.files.get('pdf')
         page_range = request.form.get('range', '')
-        if not file:
+        pdf_sha = request.form.get('pdf_sha', '')
+        workers = parse_workers(request.form.get('workers', ''))
+
+        # 优先使用 pdf-info 阶段缓存的PDF数据
+        cached = None
+        if pdf_sha:
+            with _pdf_cache_lock:
+                cached = _pdf_cache.get(pdf_sha)
+        if cached is None and not file:
             return jsonify({"ok": False, "msg": "请上传PDF文件(pdf)"}), 400
 
         start_page, end_page = parse_page_range(page_range)
+        filename = secure_filename(file.filename) if file else ''
+        if cached is not None:
+            # 仅提交 pdf_sha 时沿用 pdf-info 上传时的文件名
+            pdf_data, cached_filename = cached
+            filename = filename or cached_filename
+        else:
+            pdf_data = file.read()
+        base_name = os.path.splitext(filename or 'input.pdf')[0]
 
-        # 保存PDF到临时文件
-        with tempfile.TemporaryDirectory() as td:
-            pdf_path = os.path.join(td, secure_filename(file.filename) or 'input.pdf')
-            file.save(pdf_path)
-
-            # 输出DOCX路径
-            base_name = os.path.splitext(os.path.basename(pdf_path))[0]
-            docx_path = os.path.join(td, f"{base_name}.docx")
-
-            ok = converter.convert_single_file(pdf_path, docx_path, start_page, end_page)
-            if not ok or not os.path.exists(docx_path):
-                return jsonify({"ok": False, "msg": "转换失败"}), 500
+        # PDF直接以内存数据转换；输出DOCX写入 SpooledTemporaryFile，仅超过阈值时才落盘
+        docx_file = tempfile.SpooledTemporaryFile(max_size=DOCX_SPOOL_MAX_SIZE,
+                                                  dir=get_scratch_dir(len(pdf_data)))
+        ok = convert_stream(pdf_data, docx_file, start_page, end_page, workers)
+        if not ok:
+            docx_file.close()
+            return jsonify({"ok": False, "msg": "转换失败"}), 500
+        docx_size = docx_file.seek(0, os.SEEK_END)
+        docx_file.seek(0)
 
-            # 将DOCX作为下载返回
-            return send_file(
-                docx_path,
-                as_attachment=True,
-                download_name=f"{base_name}.docx",
-                mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-            )
+        # 将DOCX作为下载返回（响应结束后由 send_file 关闭文件）
+        # send_file 无法得知 SpooledTemporaryFile 的大小，需自行设置长度后再处理 Range 请求
+        response = send_file(
+            docx_file,
+            as_attachment=True,
+            download_name=f"{base_name}.docx",
+            mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+            conditional=False
+        )
+        response.content_length = docx_size
+        return response.make_conditional(request, accept_ranges=True, complete_length=docx_size)
 
     @app.post('/api/convert-batch')
     def convert_batch():
@@ -106,40 +281,60 @@ def create_app() -> Flask:
 
         start_page, end_page = parse_page_range(page_range)
 
-        with tempfile.TemporaryDirectory() as td:
-            out_dir = os.path.join(td, 'out')
+        # 临时目录需在zip流发送完毕后才能清理，因此不使用 with 语句
+        # 上传的PDF与转换结果都写在这里，按请求体大小估算所需空间
+        td = tempfile.TemporaryDirectory(dir=get_scratch_dir(request.content_length or 0))
+        try:
+            out_dir = os.path.join(td.name, 'out')
             os.makedirs(out_dir, exist_ok=True)
 
-            success = 0
-            for f in files:
+            tasks = []
+            arcnames = []
+            for i, f in enumerate(files):
                 if not f or not f.filename.lower().endswith('.pdf'):
                     continue
-                safe_name = secure_filename(f.filename)
-                pdf_path = os.path.join(td, safe_name or 'input.pdf')
-                f.save(pdf_path)
-                base = os.path.splitext(os.path.basename(pdf_path))[0]
-                docx_path = os.path.join(out_dir, f"{base}.docx")
-                if converter.convert_single_file(pdf_path, docx_path, start_page, end_page):
-                    success += 1
-
-            if success == 0:
+                # 不同文件名经 secure_filename 处理后可能相同（如中文文件名），
+                # 临时文件名加上序号保证各任务路径唯一，原文件名仅用于zip内的文件名
+                safe_name = secure_filename(f.filename) or 'input.pdf'
+                base = os.path.splitext(safe_name)[0]
+                pdf_path = os.path.join(td.name, f"{i}_{safe_name}")
+                _save_upload(f, pdf_path)
+                docx_path = os.path.join(out_dir, f"{i}_{base}.docx")
+                tasks.append((pdf_path, docx_path, start_page, end_page))
+                arcnames.append(f"{base}.docx")
+
+            if not tasks:
+                td.cleanup()
                 return jsonify({"ok": False, "msg": "没有文件成功转换"}), 500
+        except Exception:
+            td.cleanup()
+            raise
+
+        futures = {}
+        try:
+            # 各文件转换相互独立，多个文件时使用常驻进程池并行转换；
+            # 只有一个文件时直接在当前进程中转换，省去跨进程调度的开销
+            in_process = len(tasks) == 1
+            for task, arcname in zip(tasks, arcnames):
+                futures[_submit_conversion(task, in_process)] = (task[1], arcname)
+            converted = _iter_converted(futures)
+            # 等到第一个文件转换成功即开始返回，其余文件转换完成后依次追加到zip流
+            first = next(converted, None)
+        except Exception:
+            _cancel_and_wait(futures)
+            td.cleanup()
+            raise
+
+        if first is None:
+            _cancel_and_wait(futures)
+            td.cleanup()
+            return jsonify({"ok": False, "msg": "没有文件成功转换"}), 500
 
-            # 打包为zip返回
-            zip_buffer = io.BytesIO()
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for name in os.listdir(out_dir):
-                    full_path = os.path.join(out_dir, name)
-                    if os.path.isfile(full_path):
-                        zf.write(full_path, arcname=name)
-            zip_buffer.seek(0)
-
-            return send_file(
-                zip_buffer,
-                as_attachment=True,
-                download_name='converted_docx.zip',
-                mimetype='application/zip'
-            )
+        return Response(
+            _stream_zip(itertools.chain([first], converted), futures, td),
+            mimetype='application/zip',
+            headers={'Content-Disposition': 'attachment; filename=converted_docx.zip'}
+        )
 
     return app
 
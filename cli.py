@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+PDF转DOCX转换器 - 命令行与交互模式入口
+转换逻辑位于 pdf.py，Web 服务（app.py）无需导入本模块
+"""
+
+import os
+import sys
+
+from pdf import batch_convert, convert_single_file, get_pdf_info, setup_logging
+
+
+class InteractiveCLI:
+    """交互式命令行"""
+
+    def interactive_mode(self):
+        """交互式模式"""
+        print("\n" + "=" * 50)
+        print("🔄 PDF转DOCX转换器 - 交互模式")
+        print("=" * 50)
+
+        while True:
+            print("\n请选择操作:")
+            print("1. 转换单个PDF文件")
+            print("2. 批量转换PDF文件")
+            print("3. 查看PDF文件信息")
+            print("4. 退出程序")
+
+            choice = input("\n请输入选择 (1-4): ").strip()
+
+            if choice == '1':
+                self._interactive_single_convert()
+            elif choice == '2':
+                self._interactive_batch_convert()
+            elif choice == '3':
+                self._interactive_pdf_info()
+            elif choice == '4':
+                print("👋 谢谢使用!")
+                break
+            else:
+                print("❌ 无效选择，请重试")
+
+    def _interactive_single_convert(self):
+        """交互式单文件转换"""
+        pdf_path = input("📄 请输入PDF文件路径: ").strip().strip('"')
+
+        if not os.path.exists(pdf_path):
+            print(f"❌ 文件不存在: {pdf_path}")
+            return
+
+        # 默认输出路径
+        default_docx = os.path.splitext(pdf_path)[0] + ".docx"
+        docx_path = input(f"💾 输出DOCX文件路径 (默认: {default_docx}): ").strip().strip('"')
+
+        if not docx_path:
+            docx_path = default_docx
+
+        # 页码范围（可选）
+        page_range = input("📖 页码范围 (格式: 开始页-结束页，如 1-5，留空转换全部): ").strip()
+        start_page, end_page = 0, None
+
+        if page_range:
+            try:
+                if '-' in page_range:
+                    start, end = page_range.split('-')
+                    start_page = int(start) - 1  # 转为0基索引
+                    end_page = int(end)
+                else:
+                    start_page = int(page_range) - 1
+                    end_page = start_page + 1
+            except ValueError:
+                print("⚠️ 页码格式无效，将转换全部页面")
+
+        # 执行转换
+        success = convert_single_file(pdf_path, docx_path, start_page, end_page)
+        if success:
+            print(f"🎉 转换完成: {docx_path}")
+        else:
+            print("❌ 转换失败")
+
+    def _interactive_batch_convert(self):
+        """交互式批量转换"""
+        input_dir = input("📁 请输入PDF文件所在目录: ").strip().strip('"')
+
+        if not os.path.exists(input_dir):
+            print(f"❌ 目录不存在: {input_dir}")
+            return
+
+        output_dir = input(f"💾 输出目录 (默认: {input_dir}_converted): ").strip().strip('"')
+        if not output_dir:
+            output_dir = f"{input_dir}_converted"
+
+        # 覆盖策略在开始前一次性确认，转换过程中不再询问
+        response = input("♻️ 输出文件已存在时是否覆盖？(y/n，默认 y): ").strip().lower()
+        overwrite = response not in ['n', 'no']
+
+        success, total = batch_convert(input_dir, output_dir, overwrite=overwrite)
+        print(f"\n🎉 批量转换完成: {success}/{total} 个文件成功")
+
+    def _interactive_pdf_info(self):
+        """交互式PDF信息查看"""
+        pdf_path = input("📄 请输入PDF文件路径: ").strip().strip('"')
+
+        info = get_pdf_info(pdf_path)
+        if info:
+            print(f"\n📋 PDF文件信息:")
+            print(f"📖 页数: {info['pages']}")
+            print(f"📝 标题: {info['title'] or '未设置'}")
+            print(f"👤 作者: {info['author'] or '未设置'}")
+            print(f"📄 主题: {info['subject'] or '未设置'}")
+            print(f"🔧 创建工具: {info['creator'] or '未设置'}")
+            print(f"💾 文件大小: {info['file_size']}")
+
+
+def main():
+    """主函数"""
+    # 初始化日志
+    setup_logging()
+
+    # 检查命令行参数
+    if len(sys.argv) == 1:
+        # 没有参数，启动交互模式
+        InteractiveCLI().interactive_mode()
+    else:
+        # 命令行模式
+        if len(sys.argv) < 2:
+            print("使用方法:")
+            print("  python cli.py                    # 交互模式")
+            print("  python cli.py input.pdf          # 转换单个文件")
+            print("  python cli.py input.pdf output.docx  # 指定输出文件")
+            print("  python cli.py /path/to/pdfs batch    # 批量转换")
+            return
+
+        if sys.argv[-1] == 'batch' or os.path.isdir(sys.argv[1]):
+            # 批量转换模式
+            input_dir = sys.argv[1]
+            output_dir = sys.argv[2] if len(sys.argv) > 2 and sys.argv[2] != 'batch' else None
+            batch_convert(input_dir, output_dir)
+        else:
+            # 单文件转换模式
+            pdf_path = sys.argv[1]
+            docx_path = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(pdf_path)[0] + ".docx"
+
+            success = convert_single_file(pdf_path, docx_path)
+            if success:
+                print(f"🎉 转换完成: {docx_path}")
+            else:
+                print("❌ 转换失败")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⏹️ 用户中断操作")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ 程序发生错误: {e}")
+        sys.exit(1)
\ No newline at end of file
@@ -13,6 +13,7 @@
 """
 完整的PDF转DOCX转换器
 使用pdf2docx库，支持格式保持和批量转换
+命令行与交互模式入口见 cli.py
 作者：Assistant
 版本：1.0
 """
@@ -20,344 +21,385 @@
 import os
 import sys
 import time
+import queue
+import atexit
+import shutil
+import tempfile
 import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import IO, List, Tuple, Optional
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 
-class PDFtoDocxConverter:
-    """PDF转DOCX转换器类"""
-
-    def __init__(self, log_level=logging.INFO):
-        """初始化转换器"""
-        self.setup_logging(log_level)
-        self.logger = logging.getLogger(__name__)
-        self._check_dependencies()
-
-    def setup_logging(self, level):
-        """设置日志"""
-        logging.basicConfig(
-            level=level,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler('pdf_converter.log', encoding='utf-8')
-            ]
-        )
-
-    def _check_dependencies(self):
-        """检查并安装必要的依赖"""
-        try:
-            from pdf2docx import Converter
-            self.logger.info("✅ pdf2docx库已安装")
-        except ImportError:
-            self.logger.warning("⚠️ pdf2docx库未安装，正在自动安装...")
-            self._install_pdf2docx()
-
-    def _install_pdf2docx(self):
-        """自动安装pdf2docx库"""
+# Linux 下 /dev/shm 为内存文件系统（tmpfs），可用时临时文件优先放在这里
+SHM_DIR = '/dev/shm'
+SHM_AVAILABLE = os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK)
+# tmpfs 占用的是内存，剩余空间需达到所需大小的若干倍才使用，避免内存耗尽
+SHM_HEADROOM = 4
+
+logger = logging.getLogger(__name__)
+
+# 后台写日志文件的监听器（每个进程只启动一次）
+_log_listener = None
+
+
+def get_scratch_dir(required_bytes: int = 0) -> Optional[str]:
+    """
+    获取临时文件目录
+
+    Args:
+        required_bytes: 预计写入的字节数
+
+    Returns:
+        str: /dev/shm 可用且剩余空间充足时返回该目录，否则返回 None（使用系统默认临时目录）
+    """
+    if not SHM_AVAILABLE:
+        return None
+    try:
+        free = shutil.disk_usage(SHM_DIR).free
+    except OSError:
+        return None
+    return SHM_DIR if free >= required_bytes * SHM_HEADROOM else None
+
+
+def _bootstrap_dependencies():
+    """检查并安装必要的依赖（仅在模块导入时执行一次）"""
+    try:
+        import pdf2docx  # noqa: F401
+    except ImportError:
+        logger.warning("⚠️ pdf2docx库未安装，正在自动安装...")
         try:
             subprocess.check_call([sys.executable, "-m", "pip", "install", "pdf2docx"])
-            self.logger.info("✅ pdf2docx库安装成功")
-            # 重新导入
-            from pdf2docx import Converter
+            logger.info("✅ pdf2docx库安装成功")
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"❌ 安装pdf2docx失败: {e}")
-            self.logger.error("请手动运行: pip install pdf2docx")
+            logger.error(f"❌ 安装pdf2docx失败: {e}")
+            logger.error("请手动运行: pip install pdf2docx")
             sys.exit(1)
 
-    def convert_single_file(self, pdf_path: str, docx_path: str,
-                            start_page: int = 0, end_page: int = None) -> bool:
-        """
-        转换单个PDF文件到DOCX
 
-        Args:
-            pdf_path: PDF文件路径
-            docx_path: 输出DOCX文件路径
-            start_page: 起始页码（从0开始）
-            end_page: 结束页码（None表示到最后一页）
+_bootstrap_dependencies()
 
-        Returns:
-            bool: 转换是否成功
-        """
-        try:
-            from pdf2docx import Converter
+from pdf2docx import Converter  # noqa: E402
+import fitz  # noqa: E402  PyMuPDF，pdf2docx的依赖
 
-            # 验证输入文件
-            if not os.path.exists(pdf_path):
-                self.logger.error(f"❌ PDF文件不存在: {pdf_path}")
-                return False
 
-            # 创建输出目录
-            output_dir = os.path.dirname(docx_path)
-            if output_dir and not os.path.exists(output_dir):
-                os.makedirs(output_dir, exist_ok=True)
-                self.logger.info(f"📁 创建输出目录: {output_dir}")
+def _resolve_end_page(cv: Converter, end_page: Optional[int]) -> int:
+    """借助 Converter 已打开的文档确定结束页，不再额外解析一次PDF"""
+    page_count = cv.fitz_doc.page_count
+    return page_count if end_page is None else min(end_page, page_count)
 
-            self.logger.info(f"🔄 开始转换: {os.path.basename(pdf_path)}")
-            start_time = time.time()
 
-            # 执行转换
-            cv = Converter(pdf_path)
+def _convert_pages(cv: Converter, docx, start_page: int, end_page: Optional[int]):
+    """执行 pdf2docx 单进程转换"""
+    cv.convert(docx, start=start_page, end=_resolve_end_page(cv, end_page))
+
+
+def _convert_pages_multi_processing(pdf_path: str, docx_path: str, start_page: int,
+                                    end_page: Optional[int], workers: int):
+    """子进程入口：以 pdf2docx 多进程模式转换
+    进程的工作目录已切换为本次转换专用的临时目录，
+    pdf2docx 写入的中间文件（pages-N.json）不会与其他转换互相覆盖
+    """
+    cv = Converter(pdf_path)
+    try:
+        end_page = _resolve_end_page(cv, end_page)
+        # 拆分份数不超过实际要转换的页数
+        workers = min(workers, max(end_page - start_page, 1))
+        if workers > 1:
+            cv.convert(docx_path, start=start_page, end=end_page,
+                       multi_processing=True, cpu_count=workers)
+        else:
             cv.convert(docx_path, start=start_page, end=end_page)
+    finally:
+        cv.close()
+
+
+def _convert_with_multi_processing(pdf_path: str, docx_path: str, start_page: int,
+                                   end_page: Optional[int], workers: int):
+    """在独立子进程中按页拆分并行转换，子进程工作目录为私有临时目录
+    注意：workers 只决定页面拆分的份数，pdf2docx 内部的 Pool() 仍会按 CPU 核数创建进程
+    """
+    with tempfile.TemporaryDirectory(dir=get_scratch_dir()) as work_dir:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=os.chdir, initargs=(work_dir,)) as executor:
+            executor.submit(_convert_pages_multi_processing, os.path.abspath(pdf_path),
+                            os.path.abspath(docx_path), start_page, end_page, workers).result()
+
+
+def warm_up():
+    """预热依赖：创建并关闭一个空文档以完成 PyMuPDF 的初始化，
+    避免服务启动后的首个请求承担这部分耗时（pdf2docx 及其依赖已在模块导入时加载）"""
+    fitz.open().close()
+
+
+def setup_logging(level=logging.INFO):
+    """设置日志：文件日志经队列交由后台线程写入，不阻塞转换流程"""
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    log_queue = queue.Queue(-1)
+    file_handler = logging.FileHandler('pdf_converter.log', encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    _log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _log_listener.start()
+    # 进程退出前写完队列中剩余的日志
+    atexit.register(_log_listener.stop)
+
+    # 入队时只保留消息本身，时间和级别由文件处理器统一格式化
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(
+        level=level,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.StreamHandler(),
+            queue_handler
+        ]
+    )
+
+
+def convert_single_file(pdf_path: str, docx_path: str,
+                        start_page: int = 0, end_page: int = None,
+                        workers: int = 1) -> bool:
+    """
+    转换单个PDF文件到DOCX
+
+    Args:
+        pdf_path: PDF文件路径
+        docx_path: 输出DOCX文件路径
+        start_page: 起始页码（从0开始）
+        end_page: 结束页码（None表示到最后一页）
+        workers: 页面拆分的份数（1表示单进程转换）
+
+    Returns:
+        bool: 转换是否成功
+    """
+    try:
+        # 验证输入文件
+        if not os.path.exists(pdf_path):
+            logger.error(f"❌ PDF文件不存在: {pdf_path}")
+            return False
+
+        # 创建输出目录（直接尝试创建，目录已存在时无需额外检查）
+        output_dir = os.path.dirname(docx_path)
+        if output_dir:
+            try:
+                os.makedirs(output_dir)
+                logger.info(f"📁 创建输出目录: {output_dir}")
+            except FileExistsError:
+                pass
+
+        logger.info(f"🔄 开始转换: {os.path.basename(pdf_path)}")
+        start_time = time.time()
+
+        # 执行转换
+        if workers > 1:
+            _convert_with_multi_processing(pdf_path, docx_path, start_page, end_page, workers)
+        else:
+            cv = Converter(pdf_path)
+            _convert_pages(cv, docx_path, start_page, end_page)
             cv.close()
 
-            # 计算转换时间
-            elapsed_time = time.time() - start_time
-
-            # 检查输出文件
-            if os.path.exists(docx_path):
-                file_size = os.path.getsize(docx_path) / (1024 * 1024)  # MB
-                self.logger.info(f"✅ 转换成功: {os.path.basename(docx_path)}")
-                self.logger.info(f"📊 文件大小: {file_size:.2f} MB")
-                self.logger.info(f"⏱️ 转换耗时: {elapsed_time:.2f} 秒")
-                return True
-            else:
-                self.logger.error(f"❌ 转换失败，输出文件未创建")
-                return False
-
-        except Exception as e:
-            self.logger.error(f"❌ 转换过程中发生错误: {str(e)}")
+        # 计算转换时间
+        elapsed_time = time.time() - start_time
+
+        # 检查输出文件
+        if os.path.exists(docx_path):
+            file_size = os.path.getsize(docx_path) / (1024 * 1024)  # MB
+            logger.info(f"✅ 转换成功: {os.path.basename(docx_path)}")
+            logger.debug(f"📊 文件大小: {file_size:.2f} MB")
+            logger.debug(f"⏱️ 转换耗时: {elapsed_time:.2f} 秒")
+            return True
+        else:
+            logger.error(f"❌ 转换失败，输出文件未创建")
             return False
 
-    def batch_convert(self, input_dir: str, output_dir: str = None,
-                      file_pattern: str = "*.pdf") -> Tuple[int, int]:
-        """
-        批量转换PDF文件
+    except Exception as e:
+        logger.error(f"❌ 转换过程中发生错误: {str(e)}")
+        return False
+
+
+def convert_stream(pdf_data: bytes, docx_stream: IO[bytes],
+                   start_page: int = 0, end_page: int = None,
+                   workers: int = 1) -> bool:
+    """
+    转换内存中的PDF数据到DOCX，结果写入可写的二进制流
+
+    Args:
+        pdf_data: PDF文件内容
+        docx_stream: 输出DOCX的二进制流（如 SpooledTemporaryFile）
+        start_page: 起始页码（从0开始）
+        end_page: 结束页码（None表示到最后一页）
+        workers: 页面拆分的份数（1表示单进程转换）
+
+    Returns:
+        bool: 转换是否成功
+    """
+    try:
+        if not pdf_data:
+            logger.error("❌ PDF数据为空")
+            return False
 
-        Args:
-            input_dir: 输入目录
-            output_dir: 输出目录（默认为输入目录_converted）
-            file_pattern: 文件匹配模式
+        logger.info(f"🔄 开始转换: 内存PDF ({len(pdf_data) / (1024 * 1024):.2f} MB)")
+        start_time = time.time()
 
-        Returns:
-            tuple: (成功数量, 总数量)
-        """
-        input_path = Path(input_dir)
+        # 执行转换
+        if workers > 1:
+            # 多进程解析时子进程需按文件名重新打开PDF，先将数据写入临时目录
+            with tempfile.TemporaryDirectory(dir=get_scratch_dir(len(pdf_data))) as td:
+                pdf_path = os.path.join(td, 'input.pdf')
+                docx_path = os.path.join(td, 'output.docx')
+                with open(pdf_path, 'wb') as fh:
+                    fh.write(pdf_data)
+                _convert_with_multi_processing(pdf_path, docx_path, start_page, end_page, workers)
+                with open(docx_path, 'rb') as fh:
+                    shutil.copyfileobj(fh, docx_stream)
+        else:
+            cv = Converter(stream=pdf_data)
+            _convert_pages(cv, docx_stream, start_page, end_page)
+            cv.close()
 
-        if not input_path.exists():
-            self.logger.error(f"❌ 输入目录不存在: {input_dir}")
-            return (0, 0)
+        # 计算转换时间
+        elapsed_time = time.time() - start_time
+
+        # 检查输出内容
+        docx_stream.seek(0, os.SEEK_END)
+        file_size = docx_stream.tell() / (1024 * 1024)  # MB
+        if file_size > 0:
+            logger.info("✅ 转换成功")
+            logger.debug(f"📊 文件大小: {file_size:.2f} MB")
+            logger.debug(f"⏱️ 转换耗时: {elapsed_time:.2f} 秒")
+            return True
+        else:
+            logger.error("❌ 转换失败，输出内容为空")
+            return False
 
-        # 设置输出目录
-        if output_dir is None:
-            output_dir = f"{input_dir}_converted"
+    except Exception as e:
+        logger.error(f"❌ 转换过程中发生错误: {str(e)}")
+        return False
 
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
 
-        # 查找所有PDF文件
-        pdf_files = list(input_path.glob(file_pattern))
-        if not pdf_files:
-            self.logger.warning(f"⚠️ 在 {input_dir} 中没有找到匹配的PDF文件")
-            return (0, 0)
+def batch_convert(input_dir: str, output_dir: str = None,
+                  file_pattern: str = "*.pdf", overwrite: bool = True) -> Tuple[int, int]:
+    """
+    批量转换PDF文件
 
-        self.logger.info(f"📁 找到 {len(pdf_files)} 个PDF文件")
-        self.logger.info(f"📤 输出目录: {output_dir}")
+    Args:
+        input_dir: 输入目录
+        output_dir: 输出目录（默认为输入目录_converted）
+        file_pattern: 文件匹配模式
+        overwrite: 输出文件已存在时是否覆盖
 
-        success_count = 0
-        start_time = time.time()
+    Returns:
+        tuple: (成功数量, 总数量)
+    """
+    input_path = Path(input_dir)
 
-        for i, pdf_file in enumerate(pdf_files, 1):
-            docx_file = output_path / f"{pdf_file.stem}.docx"
+    if not input_path.exists():
+        logger.error(f"❌ 输入目录不存在: {input_dir}")
+        return (0, 0)
 
-            self.logger.info(f"📄 处理文件 [{i}/{len(pdf_files)}]: {pdf_file.name}")
+    # 设置输出目录
+    if output_dir is None:
+        output_dir = f"{input_dir}_converted"
 
-            # 检查输出文件是否已存在
-            if docx_file.exists():
-                response = input(f"文件 {docx_file.name} 已存在，是否覆盖？(y/n/a=全部/s=跳过全部): ").lower()
-                if response in ['n', 'no']:
-                    self.logger.info(f"⏭️ 跳过: {pdf_file.name}")
-                    continue
-                elif response in ['s', 'skip']:
-                    self.logger.info("⏭️ 跳过所有现有文件")
-                    break
-                elif response in ['a', 'all']:
-                    pass  # 继续覆盖所有
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
 
-            if self.convert_single_file(str(pdf_file), str(docx_file)):
-                success_count += 1
+    # 查找所有PDF文件
+    pdf_files = list(input_path.glob(file_pattern))
+    if not pdf_files:
+        logger.warning(f"⚠️ 在 {input_dir} 中没有找到匹配的PDF文件")
+        return (0, 0)
 
-            # 显示进度
-            progress = (i / len(pdf_files)) * 100
-            self.logger.info(f"📈 进度: {progress:.1f}% ({success_count}/{i} 成功)")
+    logger.info(f"📁 找到 {len(pdf_files)} 个PDF文件")
+    logger.info(f"📤 输出目录: {output_dir}")
 
-        # 批量转换完成统计
-        total_time = time.time() - start_time
-        self.logger.info(f"\n🎉 批量转换完成!")
-        self.logger.info(f"📊 成功: {success_count}/{len(pdf_files)} 个文件")
-        self.logger.info(f"⏱️ 总耗时: {total_time:.2f} 秒")
+    success_count = 0
+    start_time = time.time()
 
-        return (success_count, len(pdf_files))
+    for i, pdf_file in enumerate(pdf_files, 1):
+        docx_file = output_path / f"{pdf_file.stem}.docx"
 
-    def get_pdf_info(self, pdf_path: str) -> Optional[dict]:
-        """
-        获取PDF文件信息
+        logger.info(f"📄 处理文件 [{i}/{len(pdf_files)}]: {pdf_file.name}")
 
-        Args:
-            pdf_path: PDF文件路径
+        # 输出文件已存在且不覆盖时跳过
+        if not overwrite and docx_file.exists():
+            logger.info(f"⏭️ 跳过: {pdf_file.name}")
+            continue
 
-        Returns:
-            dict: PDF信息字典
-        """
-        try:
-            from pdf2docx import Converter
-            import fitz  # PyMuPDF，pdf2docx的依赖
-
-            doc = fitz.open(pdf_path)
-            info = {
-                'pages': doc.page_count,
-                'title': doc.metadata.get('title', ''),
-                'author': doc.metadata.get('author', ''),
-                'subject': doc.metadata.get('subject', ''),
-                'creator': doc.metadata.get('creator', ''),
-                'file_size': f"{os.path.getsize(pdf_path) / (1024 * 1024):.2f} MB"
-            }
-            doc.close()
-
-            return info
-        except Exception as e:
-            self.logger.error(f"❌ 获取PDF信息失败: {e}")
-            return None
-
-    def interactive_mode(self):
-        """交互式模式"""
-        print("\n" + "=" * 50)
-        print("🔄 PDF转DOCX转换器 - 交互模式")
-        print("=" * 50)
-
-        while True:
-            print("\n请选择操作:")
-            print("1. 转换单个PDF文件")
-            print("2. 批量转换PDF文件")
-            print("3. 查看PDF文件信息")
-            print("4. 退出程序")
-
-            choice = input("\n请输入选择 (1-4): ").strip()
-
-            if choice == '1':
-                self._interactive_single_convert()
-            elif choice == '2':
-                self._interactive_batch_convert()
-            elif choice == '3':
-                self._interactive_pdf_info()
-            elif choice == '4':
-                print("👋 谢谢使用!")
-                break
-            else:
-                print("❌ 无效选择，请重试")
-
-    def _interactive_single_convert(self):
-        """交互式单文件转换"""
-        pdf_path = input("📄 请输入PDF文件路径: ").strip().strip('"')
+        if convert_single_file(str(pdf_file), str(docx_file)):
+            success_count += 1
 
-        if not os.path.exists(pdf_path):
-            print(f"❌ 文件不存在: {pdf_path}")
-            return
+        # 显示进度
+        progress = (i / len(pdf_files)) * 100
+        logger.info(f"📈 进度: {progress:.1f}% ({success_count}/{i} 成功)")
 
-        # 默认输出路径
-        default_docx = os.path.splitext(pdf_path)[0] + ".docx"
-        docx_path = input(f"💾 输出DOCX文件路径 (默认: {default_docx}): ").strip().strip('"')
+    # 批量转换完成统计
+    total_time = time.time() - start_time
+    logger.info(f"\n🎉 批量转换完成!")
+    logger.info(f"📊 成功: {success_count}/{len(pdf_files)} 个文件")
+    logger.info(f"⏱️ 总耗时: {total_time:.2f} 秒")
 
-        if not docx_path:
-            docx_path = default_docx
+    return (success_count, len(pdf_files))
 
-        # 页码范围（可选）
-        page_range = input("📖 页码范围 (格式: 开始页-结束页，如 1-5，留空转换全部): ").strip()
-        start_page, end_page = 0, None
 
-        if page_range:
-            try:
-                if '-' in page_range:
-                    start, end = page_range.split('-')
-                    start_page = int(start) - 1  # 转为0基索引
-                    end_page = int(end)
-                else:
-                    start_page = int(page_range) - 1
-                    end_page = start_page + 1
-            except ValueError:
-                print("⚠️ 页码格式无效，将转换全部页面")
+def get_pdf_info(pdf_path: str) -> Optional[dict]:
+    """
+    获取PDF文件信息
+
+    Args:
+        pdf_path: PDF文件路径
+
+    Returns:
+        dict: PDF信息字典
+    """
+    try:
+        doc = fitz.open(pdf_path)
+        info = {
+            'pages': doc.page_count,
+            'title': doc.metadata.get('title', ''),
+            'author': doc.metadata.get('author', ''),
+            'subject': doc.metadata.get('subject', ''),
+            'creator': doc.metadata.get('creator', ''),
+            'file_size': f"{os.path.getsize(pdf_path) / (1024 * 1024):.2f} MB"
+        }
+        doc.close()
+
+        return info
+    except Exception as e:
+        logger.error(f"❌ 获取PDF信息失败: {e}")
+        return None
 
-        # 执行转换
-        success = self.convert_single_file(pdf_path, docx_path, start_page, end_page)
-        if success:
-            print(f"🎉 转换完成: {docx_path}")
-        else:
-            print("❌ 转换失败")
-
-    def _interactive_batch_convert(self):
-        """交互式批量转换"""
-        input_dir = input("📁 请输入PDF文件所在目录: ").strip().strip('"')
-
-        if not os.path.exists(input_dir):
-            print(f"❌ 目录不存在: {input_dir}")
-            return
-
-        output_dir = input(f"💾 输出目录 (默认: {input_dir}_converted): ").strip().strip('"')
-        if not output_dir:
-            output_dir = f"{input_dir}_converted"
-
-        success, total = self.batch_convert(input_dir, output_dir)
-        print(f"\n🎉 批量转换完成: {success}/{total} 个文件成功")
-
-    def _interactive_pdf_info(self):
-        """交互式PDF信息查看"""
-        pdf_path = input("📄 请输入PDF文件路径: ").strip().strip('"')
-
-        info = self.get_pdf_info(pdf_path)
-        if info:
-            print(f"\n📋 PDF文件信息:")
-            print(f"📖 页数: {info['pages']}")
-            print(f"📝 标题: {info['title'] or '未设置'}")
-            print(f"👤 作者: {info['author'] or '未设置'}")
-            print(f"📄 主题: {info['subject'] or '未设置'}")
-            print(f"🔧 创建工具: {info['creator'] or '未设置'}")
-            print(f"💾 文件大小: {info['file_size']}")
-
-
-def main():
-    """主函数"""
-    # 创建转换器实例
-    converter = PDFtoDocxConverter()
-
-    # 检查命令行参数
-    if len(sys.argv) == 1:
-        # 没有参数，启动交互模式
-        converter.interactive_mode()
-    else:
-        # 命令行模式
-        if len(sys.argv) < 2:
-            print("使用方法:")
-            print("  python pdf2docx_complete.py                    # 交互模式")
-            print("  python pdf2docx_complete.py input.pdf          # 转换单个文件")
-            print("  python pdf2docx_complete.py input.pdf output.docx  # 指定输出文件")
-            print("  python pdf2docx_complete.py /path/to/pdfs batch    # 批量转换")
-            return
-
-        if sys.argv[-1] == 'batch' or os.path.isdir(sys.argv[1]):
-            # 批量转换模式
-            input_dir = sys.argv[1]
-            output_dir = sys.argv[2] if len(sys.argv) > 2 and sys.argv[2] != 'batch' else None
-            converter.batch_convert(input_dir, output_dir)
-        else:
-            # 单文件转换模式
-            pdf_path = sys.argv[1]
-            docx_path = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(pdf_path)[0] + ".docx"
 
-            success = converter.convert_single_file(pdf_path, docx_path)
-            if success:
-                print(f"🎉 转换完成: {docx_path}")
-            else:
-                print("❌ 转换失败")
+def get_pdf_info_bytes(pdf_data: bytes) -> Optional[dict]:
+    """
+    获取内存中PDF数据的信息
 
+    Args:
+        pdf_data: PDF文件内容
 
-if __name__ == "__main__":
+    Returns:
+        dict: PDF信息字典
+    """
     try:
-        main()
-    except KeyboardInterrupt:
-        print("\n\n⏹️ 用户中断操作")
-        sys.exit(0)
+        doc = fitz.open(stream=pdf_data, filetype='pdf')
+        info = {
+            'pages': doc.page_count,
+            'title': doc.metadata.get('title', ''),
+            'author': doc.metadata.get('author', ''),
+            'subject': doc.metadata.get('subject', ''),
+            'creator': doc.metadata.get('creator', ''),
+            'file_size': f"{len(pdf_data) / (1024 * 1024):.2f} MB"
+        }
+        doc.close()
+
+        return info
     except Exception as e:
-        print(f"\n❌ 程序发生错误: {e}")
-        sys.exit(1)
\ No newline at end of file
+        logger.error(f"❌ 获取PDF信息失败: {e}")
+        return None